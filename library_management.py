@@ -11,11 +11,19 @@ Features:
 - Premium Add-ons : Block members above fine limit, categorized shelves,
                     auto-reminders for due/overdue books,
                     PDF export of borrowing & fines summary.
+- Persistence     : Data snapshot saved on exit, reloaded on start.
 """
 
+import io
+import os
+import pickle
+import sys
+from array import array
+from bisect import bisect_left, bisect_right, insort
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from datetime import date, datetime
+from functools import cached_property
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 # ----------------- CONFIGURATION CONSTANTS -----------------
 FINE_PER_DAY = 5          # Fine per late day (₹)
@@ -24,6 +32,9 @@ ISSUE_DAYS = 14           # Default issue period in days
 
 DATE_FORMAT = "%d-%m-%Y"  # For displaying dates
 
+STATE_FILE = "library_state.pkl"  # Snapshot saved on exit, loaded on start
+STATE_VERSION = 4                 # Bump when the pickled models change
+
 
 # ----------------- DATA MODELS ----------------
 @dataclass
@@ -34,6 +45,21 @@ class Book:
     category: str          # Fiction / Science / etc.
     total_copies: int
     available_copies: int
+    # Lowercased copies of the searchable fields (see refresh_search_fields)
+    _title_lc: str = field(default="", init=False, repr=False, compare=False)
+    _author_lc: str = field(default="", init=False, repr=False, compare=False)
+    _category_lc: str = field(default="", init=False, repr=False, compare=False)
+    _search_blob: str = field(default="", init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.refresh_search_fields()
+
+    def refresh_search_fields(self) -> None:
+        """Re-derive the lowercased fields after title/author/category change."""
+        self._title_lc = self.title.casefold()
+        self._author_lc = self.author.casefold()
+        self._category_lc = self.category.casefold()
+        self._search_blob = f"{self._title_lc}\x1f{self._author_lc}\x1f{self._category_lc}"
 
     def __str__(self) -> str:
         return (
@@ -48,15 +74,31 @@ class Member:
     member_id: str
     name: str
     phone: str
-    blocked: bool = False
-    outstanding_fine: int = 0
-    borrowed_books: List[str] = field(default_factory=list)
+    # Derived from the fine by the outstanding_fine setter
+    blocked: bool = field(default=False, init=False)
+    _outstanding_fine: int = field(default=0, init=False)
+    # Book ID -> copies currently held (a member may hold several)
+    borrowed_books: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def outstanding_fine(self) -> int:
+        return self._outstanding_fine
+
+    @outstanding_fine.setter
+    def outstanding_fine(self, value: int) -> None:
+        """Set the fine and re-decide block status in the same step."""
+        self._outstanding_fine = value
+        self.blocked = value >= MAX_FINE_LIMIT
+        if self.blocked:
+            blocked_members.add(self.member_id)
+        else:
+            blocked_members.discard(self.member_id)
 
     def __str__(self) -> str:
         status = "BLOCKED" if self.blocked else "ACTIVE"
         return (
             f"[{self.member_id}] {self.name} ({self.phone}) | "
-            f"Books borrowed: {len(self.borrowed_books)} | "
+            f"Books borrowed: {sum(self.borrowed_books.values())} | "
             f"Outstanding fine: ₹{self.outstanding_fine} | Status: {status}"
         )
 
@@ -66,69 +108,225 @@ class IssueRecord:
     issue_id: int
     book_id: str
     member_id: str
-    issue_date: datetime
-    due_date: datetime
-    return_date: Optional[datetime] = None
+    # Dates are stored as day numbers (date.toordinal)
+    issue_ordinal: int
+    due_ordinal: int
+    return_ordinal: Optional[int] = None
     fine_charged: int = 0
 
-    def is_overdue(self, on_date: Optional[datetime] = None) -> bool:
-        """Check if this issue is overdue on the given date (or today)."""
-        if on_date is None:
-            on_date = datetime.today()
-        if self.return_date is not None:
-            return self.return_date > self.due_date
-        return on_date > self.due_date
-
-    def days_late(self, on_date: Optional[datetime] = None) -> int:
+    # Display strings, formatted on first use
+    @cached_property
+    def issue_str(self) -> str:
+        return format_ordinal(self.issue_ordinal)
+
+    @cached_property
+    def due_str(self) -> str:
+        return format_ordinal(self.due_ordinal)
+
+    @cached_property
+    def return_str(self) -> str:
+        if self.return_ordinal is None:
+            return "-"
+        return format_ordinal(self.return_ordinal)
+
+    def mark_returned(self, return_ordinal: int) -> None:
+        """Record the return date (and drop its stale display string)."""
+        self.return_ordinal = return_ordinal
+        self.__dict__.pop("return_str", None)
+
+    def is_overdue(self, on_ordinal: Optional[int] = None) -> bool:
+        """Check if this issue is overdue on the given day ordinal (or today)."""
+        if self.return_ordinal is not None:
+            return self.return_ordinal > self.due_ordinal
+        if on_ordinal is None:
+            on_ordinal = datetime.today().toordinal()
+        return on_ordinal > self.due_ordinal
+
+    def days_late(self, on_ordinal: Optional[int] = None) -> int:
         """Number of late days (0 if not late)."""
-        if on_date is None:
-            on_date = datetime.today()
-        effective_date = self.return_date or on_date
-        delta_days = (effective_date.date() - self.due_date.date()).days
-        return max(0, delta_days)
+        if self.return_ordinal is not None:
+            on_ordinal = self.return_ordinal
+        elif on_ordinal is None:
+            on_ordinal = datetime.today().toordinal()
+        return max(0, on_ordinal - self.due_ordinal)
 
     def __str__(self) -> str:
-        status = "Returned" if self.return_date else "Issued"
-        issue_str = self.issue_date.strftime(DATE_FORMAT)
-        due_str = self.due_date.strftime(DATE_FORMAT)
-        ret_str = self.return_date.strftime(DATE_FORMAT) if self.return_date else "-"
+        status = "Issued" if self.return_ordinal is None else "Returned"
         return (
             f"IssueID: {self.issue_id} | Book: {self.book_id} | "
-            f"Member: {self.member_id} | Issue: {issue_str} | Due: {due_str} | "
-            f"Return: {ret_str} | Fine: ₹{self.fine_charged} | Status: {status}"
+            f"Member: {self.member_id} | Issue: {self.issue_str} | "
+            f"Due: {self.due_str} | "
+            f"Return: {self.return_str} | Fine: ₹{self.fine_charged} | Status: {status}"
         )
 
 
 # ----------------- IN-MEMORY "DATABASES" -----------------
 books: Dict[str, Book] = {}
 members: Dict[str, Member] = {}
+blocked_members: Set[str] = set()  # kept by Member.outstanding_fine's setter
 issues: Dict[int, IssueRecord] = {}
 next_issue_id: int = 1  # auto-increment issue IDs
 
+# Active (not returned) issue IDs
+active_issue_ids: Set[int] = set()
+# Active issues sorted by (due ordinal, issue ID); entries also carry the
+# display fields reminders need:
+# (due ordinal, issue ID, book title, member name, due date string)
+_active_by_due: List[Tuple[int, int, str, str, str]] = []
+
+# Per-issue day ordinals as dense columns (index = issue ID - 1) for bulk
+# fine arithmetic in reports; a return ordinal of -1 means not returned.
+_due_ordinals = array("q")
+_return_ordinals = array("q")
+
+
+# ----------------- SEARCH INDEXES -----------------
+@dataclass
+class Trie:
+    """Character trie; every node holds the IDs of all books below it."""
+    children: Dict[str, "Trie"] = field(default_factory=dict)
+    ids: Set[str] = field(default_factory=set)
+
+    def insert(self, word: str, book_id: str) -> None:
+        node = self
+        for ch in word:
+            node = node.children.setdefault(ch, Trie())
+            node.ids.add(book_id)
+
+    def remove(self, word: str, book_id: str) -> None:
+        path = []
+        node = self
+        for ch in word:
+            child = node.children.get(ch)
+            if child is None:
+                break
+            child.ids.discard(book_id)
+            path.append((node, ch, child))
+            node = child
+        # Drop nodes that no longer lead to any book
+        for parent, ch, child in reversed(path):
+            if child.ids:
+                break
+            del parent.children[ch]
+
+    def find(self, prefix: str) -> Set[str]:
+        """IDs of books having a word that starts with prefix."""
+        node = self
+        for ch in prefix:
+            node = node.children.get(ch)
+            if node is None:
+                return set()
+        return node.ids
+
+
+# Prefix trie over title & author words
+_word_trie = Trie()
+
+# All books' search blobs joined into one "\x1f"-separated string for
+# substring search; _corpus_starts[i] is where _corpus_ids[i]'s text begins.
+# Rebuilt lazily on the next search after any book is (re)indexed.
+_corpus: str = ""
+_corpus_starts: List[int] = []
+_corpus_ids: List[str] = []
+_corpus_stale: bool = True
+
+
+def _trie_words(book: Book) -> Set[str]:
+    return set(book._title_lc.split() + book._author_lc.split())
+
+
+def _index_book(book: Book) -> None:
+    """Add a book to the prefix trie and mark the search corpus stale."""
+    global _corpus_stale
+    _corpus_stale = True
+    for word in _trie_words(book):
+        _word_trie.insert(word, book.book_id)
+
+
+def _unindex_book(book: Book) -> None:
+    """Remove a book's current words from the search indexes."""
+    _untrie_book(book)
+
+
+def _untrie_book(book: Book) -> None:
+    """Remove a book's current title/author words from the prefix trie."""
+    for word in _trie_words(book):
+        _word_trie.remove(word, book.book_id)
+
+
+def _rebuild_corpus() -> None:
+    """Re-join the search corpus from the current books."""
+    global _corpus, _corpus_stale
+    parts = []
+    _corpus_starts.clear()
+    _corpus_ids.clear()
+    pos = 0
+    for book in books.values():
+        _corpus_starts.append(pos)
+        _corpus_ids.append(book.book_id)
+        part = "\x1f" + book._search_blob
+        parts.append(part)
+        pos += len(part)
+    _corpus = "".join(parts)
+    _corpus_stale = False
+
+
+def _substring_search(keyword: str) -> List[str]:
+    """IDs of books whose title/author/category contains keyword."""
+    if _corpus_stale:
+        _rebuild_corpus()
+    found = []
+    pos = _corpus.find(keyword)
+    while pos != -1:
+        i = bisect_right(_corpus_starts, pos) - 1
+        found.append(_corpus_ids[i])
+        # One hit per book is enough: resume at the next book's text
+        if i + 1 == len(_corpus_starts):
+            break
+        pos = _corpus.find(keyword, _corpus_starts[i + 1])
+    return found
+
 
 # ----------------- HELPER FUNCTIONS -----------------
 def input_int(prompt: str, minimum: int = 0) -> int:
     while True:
-        try:
-            value = int(input(prompt))
-            if value < minimum:
-                print(f"Value must be >= {minimum}")
-                continue
-            return value
-        except ValueError:
+        text = input(prompt).strip()
+        # Only non-negative integers are ever asked for
+        if not text.isdecimal():
             print("Please enter a valid integer.")
+            continue
+        value = int(text)
+        if value < minimum:
+            print(f"Value must be >= {minimum}")
+            continue
+        return value
+
+
+def format_ordinal(ordinal: int) -> str:
+    """Format a day number (date.toordinal) with DATE_FORMAT."""
+    return date.fromordinal(ordinal).strftime(DATE_FORMAT)
+
+
+def print_lines(items: Iterable[object]) -> None:
+    """Print each item on its own line using a single stdout write."""
+    sys.stdout.write("\n".join(map(str, items)) + "\n")
 
 
 def pause() -> None:
     input("\nPress ENTER to continue...")
 
 
-def check_and_update_block_status(member: Member) -> None:
-    """Block member if outstanding fine crosses limit."""
-    if member.outstanding_fine >= MAX_FINE_LIMIT:
-        member.blocked = True
-    else:
-        member.blocked = False
+def _reminder_entry(record: IssueRecord) -> Tuple[int, int, str, str, str]:
+    """Build the _active_by_due entry for an active issue."""
+    book = books.get(record.book_id)
+    member = members.get(record.member_id)
+    return (
+        record.due_ordinal,
+        record.issue_id,
+        book.title if book else "Unknown",
+        member.name if member else "Unknown",
+        record.due_str,
+    )
 
 
 # ----------------- BOOK FUNCTIONS ----------------
@@ -143,7 +341,7 @@ def add_book() -> None:
     category = input("Enter Category (Fiction/Science/etc.): ").strip()
     total_copies = input_int("Enter Total Copies: ", minimum=1)
 
-    books[book_id] = Book(
+    book = Book(
         book_id=book_id,
         title=title,
         author=author,
@@ -151,6 +349,8 @@ def add_book() -> None:
         total_copies=total_copies,
         available_copies=total_copies,
     )
+    books[book_id] = book
+    _index_book(book)
     print("Book added successfully.")
 
 
@@ -159,28 +359,35 @@ def view_all_books() -> None:
     if not books:
         print("No books in inventory.")
         return
-    for book in books.values():
-        print(book)
+    print_lines(books.values())
 
 
 def search_books() -> None:
     print("\n--- Search Books ---")
-    keyword = input("Enter keyword (title/author/category): ").strip().lower()
+    keyword = input("Enter keyword (title/author/category): ").strip().casefold()
     if not keyword:
         print("Keyword cannot be empty.")
         return
 
-    results = [
-        b for b in books.values()
-        if keyword in b.title.lower()
-        or keyword in b.author.lower()
-        or keyword in b.category.lower()
-    ]
+    results = [books[book_id] for book_id in _substring_search(keyword)]
     if not results:
         print("No matching books found.")
     else:
-        for b in results:
-            print(b)
+        print_lines(results)
+
+
+def search_books_by_prefix() -> None:
+    print("\n--- Books Starting With... ---")
+    prefix = input("Enter start of a title/author word: ").strip().casefold()
+    if not prefix:
+        print("Prefix cannot be empty.")
+        return
+
+    book_ids = _word_trie.find(prefix)
+    if not book_ids:
+        print("No matching books found.")
+    else:
+        print_lines(books[book_id] for book_id in sorted(book_ids))
 
 
 def update_book() -> None:
@@ -197,12 +404,20 @@ def update_book() -> None:
     new_category = input(f"Category [{book.category}]: ").strip()
     new_total_str = input(f"Total copies [{book.total_copies}]: ").strip()
 
+    _unindex_book(book)
     if new_title:
         book.title = new_title
     if new_author:
         book.author = new_author
     if new_category:
         book.category = new_category
+    book.refresh_search_fields()
+    _index_book(book)
+    if new_title:
+        # Reminder entries carry the title, refresh this book's ones
+        for i, entry in enumerate(_active_by_due):
+            if issues[entry[1]].book_id == book_id:
+                _active_by_due[i] = _reminder_entry(issues[entry[1]])
     if new_total_str:
         try:
             new_total = int(new_total_str)
@@ -239,8 +454,7 @@ def view_all_members() -> None:
     if not members:
         print("No members registered.")
         return
-    for m in members.values():
-        print(m)
+    print_lines(members.values())
 
 
 def search_member_by_id() -> None:
@@ -252,7 +466,11 @@ def search_member_by_id() -> None:
         return
     print(member)
     if member.borrowed_books:
-        print("Borrowed books:", ", ".join(member.borrowed_books))
+        print("Borrowed books:", ", ".join(
+            book_id
+            for book_id, copies in member.borrowed_books.items()
+            for _ in range(copies)
+        ))
     else:
         print("No books currently borrowed.")
 
@@ -274,7 +492,6 @@ def issue_book() -> None:
         print("Member not found.")
         return
 
-    check_and_update_block_status(member)
     if member.blocked:
         print("Member is BLOCKED due to high outstanding fines.")
         return
@@ -282,40 +499,39 @@ def issue_book() -> None:
         print("No available copies to issue.")
         return
 
-    issue_date = datetime.today()
-    due_date = issue_date + timedelta(days=ISSUE_DAYS)
+    issue_ordinal = datetime.today().toordinal()
 
     record = IssueRecord(
         issue_id=next_issue_id,
         book_id=book_id,
         member_id=member_id,
-        issue_date=issue_date,
-        due_date=due_date,
+        issue_ordinal=issue_ordinal,
+        due_ordinal=issue_ordinal + ISSUE_DAYS,
     )
     issues[next_issue_id] = record
+    insort(_active_by_due, _reminder_entry(record))
+    _due_ordinals.append(record.due_ordinal)
+    _return_ordinals.append(-1)
+    active_issue_ids.add(next_issue_id)
     next_issue_id += 1
 
     book.available_copies -= 1
-    member.borrowed_books.append(book_id)
+    member.borrowed_books[book_id] = member.borrowed_books.get(book_id, 0) + 1
 
     print("Book issued successfully.")
-    print(f"Due date: {due_date.strftime(DATE_FORMAT)}")
+    print(f"Due date: {record.due_str}")
     print(record)
 
 
 def return_book() -> None:
     print("\n--- Return Book ---")
-    issue_id_str = input("Enter Issue ID: ").strip()
-    if not issue_id_str.isdigit():
-        print("Issue ID must be a number.")
-        return
-    issue_id = int(issue_id_str)
+    issue_id = input_int("Enter Issue ID: ", minimum=1)
     record = issues.get(issue_id)
 
     if not record:
         print("Issue record not found.")
         return
-    if record.return_date:
+    if record.return_ordinal is not None:
         print("Book already returned.")
         return
 
@@ -326,20 +542,31 @@ def return_book() -> None:
         print("Book or Member record missing. Cannot proceed safely.")
         return
 
-    return_date = datetime.today()
-    record.return_date = return_date
+    # Locate the due-date entry before changing anything
+    key = (record.due_ordinal, issue_id)
+    pos = bisect_left(_active_by_due, key)
+    if pos == len(_active_by_due) or _active_by_due[pos][:2] != key:
+        print("Active issue index is out of sync. Cannot proceed safely.")
+        return
+
+    record.mark_returned(datetime.today().toordinal())
+    _return_ordinals[issue_id - 1] = record.return_ordinal
+    del _active_by_due[pos]
+    active_issue_ids.discard(issue_id)
 
-    late_days = record.days_late(return_date)
+    late_days = record.days_late()
     fine = late_days * FINE_PER_DAY
     record.fine_charged = fine
 
     member.outstanding_fine += fine
-    check_and_update_block_status(member)
 
     # update book & member
     book.available_copies += 1
-    if record.book_id in member.borrowed_books:
-        member.borrowed_books.remove(record.book_id)
+    copies = member.borrowed_books.get(record.book_id, 0)
+    if copies > 1:
+        member.borrowed_books[record.book_id] = copies - 1
+    else:
+        member.borrowed_books.pop(record.book_id, None)
 
     print("Book return recorded.")
     print(f"Late days: {late_days}, Fine charged: ₹{fine}")
@@ -351,12 +578,10 @@ def return_book() -> None:
 # ----------------- REPORTS & REMINDERS -----------------
 def view_active_issues() -> None:
     print("\n--- Active Issues (Not Returned) ---")
-    active = [r for r in issues.values() if r.return_date is None]
-    if not active:
+    if not active_issue_ids:
         print("No active issues.")
         return
-    for r in active:
-        print(r)
+    print_lines(issues[i] for i in sorted(active_issue_ids))
 
 
 def view_issue_history() -> None:
@@ -364,45 +589,135 @@ def view_issue_history() -> None:
     if not issues:
         print("No issue records.")
         return
-    for r in issues.values():
-        print(r)
+    print_lines(issues.values())
 
 
 def show_due_and_overdue_reminders() -> None:
     print("\n--- Due / Overdue Reminders ---")
-    today = datetime.today()
+    today_ord = datetime.today().toordinal()
+    cutoff = today_ord + 2
     any_found = False
 
-    for r in issues.values():
-        if r.return_date is not None:
-            continue
-
-        days_to_due = (r.due_date.date() - today.date()).days
-        member = members.get(r.member_id)
-        book = books.get(r.book_id)
-        member_name = member.name if member else "Unknown"
-        book_title = book.title if book else "Unknown"
+    # Sorted by due date: stop at the first issue due after the cutoff
+    for due_ord, issue_id, book_title, member_name, due_str in _active_by_due:
+        if due_ord > cutoff:
+            break
+        days_to_due = due_ord - today_ord
 
+        any_found = True
         if days_to_due < 0:
-            any_found = True
             print(
-                f"[OVERDUE] IssueID {r.issue_id} | Book: {book_title} "
-                f"| Member: {member_name} | Due: {r.due_date.strftime(DATE_FORMAT)} "
+                f"[OVERDUE] IssueID {issue_id} | Book: {book_title} "
+                f"| Member: {member_name} | Due: {due_str} "
                 f"| Late by {-days_to_due} day(s)"
             )
-        elif days_to_due <= 2:
-            any_found = True
+        else:
             print(
-                f"[DUE SOON] IssueID {r.issue_id} | Book: {book_title} "
+                f"[DUE SOON] IssueID {issue_id} | Book: {book_title} "
                 f"| Member: {member_name} | Due in {days_to_due} day(s) "
-                f"on {r.due_date.strftime(DATE_FORMAT)}"
+                f"on {due_str}"
             )
 
     if not any_found:
         print("No books are due soon or overdue.")
 
 
+# ----------------- REPORT STATISTICS -----------------
+# Below this many issue records the Python loop beats numba's compile cost
+NUMBA_MIN_RECORDS = 100_000
+
+# (due ordinals, return ordinals, today's ordinal) -> (late days, overdue)
+LateDaysKernel = Callable[[array, array, int], Tuple[int, int]]
+_late_days_kernel: Optional[LateDaysKernel] = None  # see _get_late_days_kernel
+
+
+def _late_days_python(due: array, ret: array, today_ord: int) -> Tuple[int, int]:
+    total = overdue = 0
+    for due_ord, ret_ord in zip(due, ret):
+        active = ret_ord < 0
+        late = (today_ord if active else ret_ord) - due_ord
+        if late > 0:
+            total += late
+            if active:
+                overdue += 1
+    return total, overdue
+
+
+def _get_late_days_kernel() -> LateDaysKernel:
+    """Numba-compiled late-days kernel, or the pure Python one without numba."""
+    global _late_days_kernel
+    if _late_days_kernel is not None:
+        return _late_days_kernel
+    try:
+        import numpy as np
+        from numba import njit, prange
+    except ImportError:
+        _late_days_kernel = _late_days_python
+        return _late_days_kernel
+
+    @njit(parallel=True, cache=True)
+    def kernel(due, ret, today_ord):
+        total = 0
+        overdue = 0
+        for i in prange(due.size):
+            active = ret[i] < 0
+            late = (today_ord if active else ret[i]) - due[i]
+            if late > 0:
+                total += late
+                if active:
+                    overdue += 1
+        return total, overdue
+
+    def late_days_numba(due: array, ret: array, today_ord: int) -> Tuple[int, int]:
+        total, overdue = kernel(
+            np.frombuffer(due, dtype=np.int64),
+            np.frombuffer(ret, dtype=np.int64),
+            today_ord,
+        )
+        return int(total), int(overdue)
+
+    _late_days_kernel = late_days_numba
+    return _late_days_kernel
+
+
+def fine_summary(today_ord: int) -> Tuple[int, int]:
+    """Return (late fines incl. unreturned books, overdue active issues)."""
+    if not _due_ordinals:
+        return 0, 0
+    if len(_due_ordinals) >= NUMBA_MIN_RECORDS:
+        late_days = _get_late_days_kernel()
+    else:
+        late_days = _late_days_python
+    total_days, overdue = late_days(_due_ordinals, _return_ordinals, today_ord)
+    return total_days * FINE_PER_DAY, overdue
+
+
 # ----------------- PDF EXPORT -----------------
+def _draw_pdf_lines(c, lines: List[str], y: float, page_top: float,
+                    contd_heading: Optional[str] = None) -> float:
+    """Draw lines as one text object per page, starting new pages below y=80.
+
+    Returns the y position below the last line drawn.
+    """
+    while lines:
+        if y < 80:
+            c.showPage()
+            y = page_top
+            if contd_heading:
+                c.setFont("Helvetica-Bold", 12)
+                c.drawString(50, y, contd_heading)
+                y -= 20
+        per_page = int((y - 80) // 12) + 1
+        chunk, lines = lines[:per_page], lines[per_page:]
+        text = c.beginText(60, y)
+        text.setFont("Helvetica", 9)
+        text.setLeading(12)
+        text.textLines(chunk)
+        c.drawText(text)
+        y -= 12 * len(chunk)
+    return y
+
+
 def export_pdf_report() -> None:
     print("\n--- Export PDF Report ---")
     filename = input("Enter output filename (default: library_report.pdf): ").strip()
@@ -419,7 +734,27 @@ def export_pdf_report() -> None:
         print("Install it with: pip install reportlab")
         return
 
-    c = canvas.Canvas(filename, pagesize=A4)
+    today = datetime.today()
+    today_ord = today.toordinal()
+
+    active_lines = []
+    for r in (issues[i] for i in sorted(active_issue_ids)):
+        member = members.get(r.member_id)
+        book = books.get(r.book_id)
+        active_lines.append(
+            f"ID {r.issue_id} | Book: {book.title if book else r.book_id} | "
+            f"Member: {member.name if member else r.member_id} | "
+            f"Due: {r.due_str}"
+        )
+    member_lines = [
+        f"{m.member_id} - {m.name} | Phone: {m.phone} | "
+        f"Fine: ₹{m.outstanding_fine} | Status: {'BLOCKED' if m.blocked else 'ACTIVE'}"
+        for m in members.values()
+    ]
+
+    # Build the PDF in memory, then write the file in one go
+    buf = io.BytesIO()
+    c = canvas.Canvas(buf, pagesize=A4)
     width, height = A4
 
     y = height - 50
@@ -428,8 +763,19 @@ def export_pdf_report() -> None:
     y -= 30
 
     c.setFont("Helvetica", 10)
-    today_str = datetime.today().strftime(DATE_FORMAT)
+    today_str = today.strftime(DATE_FORMAT)
     c.drawString(50, y, f"Generated on: {today_str}")
+    y -= 15
+    c.drawString(
+        50, y, f"Members: {len(members)} | Blocked: {len(blocked_members)}"
+    )
+    y -= 15
+    late_fines, overdue_count = fine_summary(today_ord)
+    c.drawString(
+        50, y,
+        f"Overdue issues: {overdue_count} | "
+        f"Late fines incl. unreturned books: ₹{late_fines}",
+    )
     y -= 30
 
     # Active Issues
@@ -437,24 +783,11 @@ def export_pdf_report() -> None:
     c.drawString(50, y, "Active Issues:")
     y -= 20
     c.setFont("Helvetica", 9)
-    active = [r for r in issues.values() if r.return_date is None]
-    if not active:
+    if not active_lines:
         c.drawString(60, y, "No active issues.")
         y -= 15
     else:
-        for r in active:
-            if y < 80:
-                c.showPage()
-                y = height - 50
-            member = members.get(r.member_id)
-            book = books.get(r.book_id)
-            line = (
-                f"ID {r.issue_id} | Book: {book.title if book else r.book_id} | "
-                f"Member: {member.name if member else r.member_id} | "
-                f"Due: {r.due_date.strftime(DATE_FORMAT)}"
-            )
-            c.drawString(60, y, line)
-            y -= 12
+        y = _draw_pdf_lines(c, active_lines, y, height - 50)
 
     # Members & Fines
     if y < 120:
@@ -465,29 +798,107 @@ def export_pdf_report() -> None:
     c.drawString(50, y, "Members & Outstanding Fines:")
     y -= 20
     c.setFont("Helvetica", 9)
-    if not members:
+    if not member_lines:
         c.drawString(60, y, "No members.")
         y -= 15
     else:
-        for m in members.values():
-            if y < 80:
-                c.showPage()
-                y = height - 50
-                c.setFont("Helvetica-Bold", 12)
-                c.drawString(50, y, "Members & Outstanding Fines (contd.):")
-                y -= 20
-                c.setFont("Helvetica", 9)
-            line = (
-                f"{m.member_id} - {m.name} | Phone: {m.phone} | "
-                f"Fine: ₹{m.outstanding_fine} | Status: {'BLOCKED' if m.blocked else 'ACTIVE'}"
-            )
-            c.drawString(60, y, line)
-            y -= 12
+        y = _draw_pdf_lines(
+            c, member_lines, y, height - 50,
+            contd_heading="Members & Outstanding Fines (contd.):",
+        )
 
     c.save()
+    with open(filename, "wb") as f:
+        f.write(buf.getbuffer())
     print(f"PDF report saved as '{filename}'.")
 
 
+# ----------------- PERSISTENCE -----------------
+def save_state(path: str = STATE_FILE) -> None:
+    """Pickle books, members and issue records to path.
+
+    The snapshot is written to a temporary file first and then moved over
+    path, so a failed write never leaves a truncated snapshot behind.
+    """
+    state = (STATE_VERSION, books, members, issues, next_issue_id)
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            pickle.dump(state, f, protocol=5)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def load_state(path: str = STATE_FILE) -> bool:
+    """Load a snapshot written by save_state and rebuild derived state.
+
+    Returns False (leaving the current data untouched) if there is no
+    usable snapshot at path.
+    """
+    global next_issue_id
+    if not os.path.exists(path):
+        return False
+    try:
+        with open(path, "rb") as f:
+            version, saved_books, saved_members, saved_issues, saved_next_id = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError,
+            ValueError, TypeError, ImportError) as e:
+        print(f"Could not read saved data from '{path}': {e}")
+        return False
+    if version != STATE_VERSION:
+        print(f"Ignoring saved data in '{path}' (incompatible version).")
+        return False
+
+    books.clear()
+    books.update(saved_books)
+    members.clear()
+    members.update(saved_members)
+    issues.clear()
+    issues.update(saved_issues)
+    next_issue_id = saved_next_id
+    _rebuild_indexes()
+    return True
+
+
+def _rebuild_indexes() -> None:
+    """Recompute all derived state from books, members and issues.
+
+    Cached fields restored by pickle (lowercased search fields, block
+    status, formatted dates) are re-derived too, so they always follow
+    the current code and configuration rather than the snapshot.
+    """
+    global _corpus_stale
+    _corpus_stale = True
+    _word_trie.children.clear()
+    for book in books.values():
+        book.refresh_search_fields()
+        _index_book(book)
+
+    blocked_members.clear()
+    for m in members.values():
+        m.outstanding_fine = m.outstanding_fine  # setter re-decides blocking
+
+    active_issue_ids.clear()
+    _active_by_due.clear()
+    # Issue IDs run 1..next_issue_id-1, so dict order matches column order
+    _due_ordinals[:] = array("q", (r.due_ordinal for r in issues.values()))
+    _return_ordinals[:] = array(
+        "q", (-1 if r.return_ordinal is None else r.return_ordinal
+              for r in issues.values())
+    )
+    for r in issues.values():
+        for name in ("issue_str", "due_str", "return_str"):
+            r.__dict__.pop(name, None)
+        if r.return_ordinal is not None:
+            continue
+        active_issue_ids.add(r.issue_id)
+        _active_by_due.append(_reminder_entry(r))
+    _active_by_due.sort()
+
+
 # ----------------- MAIN MENU -----------------
 def show_menu() -> None:
     print("\n========== Library Management & Fine System ==========")
@@ -504,10 +915,14 @@ def show_menu() -> None:
     print("11. View Issue History")
     print("12. Show Due/Overdue Reminders")
     print("13. Export PDF Report")
+    print("14. Books Starting With...")
     print("0.  Exit")
 
 
 def main() -> None:
+    if load_state():
+        print(f"Loaded saved library data from '{STATE_FILE}'.")
+
     while True:
         show_menu()
         choice = input("Enter choice: ").strip()
@@ -551,7 +966,15 @@ def main() -> None:
         elif choice == "13":
             export_pdf_report()
             pause()
+        elif choice == "14":
+            search_books_by_prefix()
+            pause()
         elif choice == "0":
+            try:
+                save_state()
+                print(f"Library data saved to '{STATE_FILE}'.")
+            except OSError as e:
+                print(f"Could not save library data to '{STATE_FILE}': {e}")
             print("Exiting Library Management System. Goodbye!")
             break
         else: